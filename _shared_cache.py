@@ -0,0 +1,160 @@
+"""
+Indicator frames shared between uvicorn workers through shared memory.
+
+With `uvicorn --workers N` each worker has its own in-process cache, so every
+indicator would be downloaded N times. The first worker to fetch a frame
+publishes it as an Arrow IPC stream in a named shared memory block; the
+others attach to the block and read the frame from it, so each indicator
+is downloaded once per machine. This saves network fetches, not memory:
+every worker still builds its own indexed copy of the rows.
+
+Block layout: payload length (uint64), publish time (float64, epoch
+seconds), then the IPC stream. A zero length means the writer is not done.
+
+Blocks are kept out of each process's resource tracker, which would otherwise
+unlink them when the worker that created or attached them exits. They are
+removed by `discard_frame` or when found stale, and at most one exists per
+indicator.
+"""
+
+import os
+import shutil
+import struct
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+
+
+_HEADER = struct.Struct("<Qd")
+_PREFIX = "fingertips_"
+_SHM_DIR = "/dev/shm"
+
+# Keep Arrow strings Arrow-backed when frames are rebuilt from a block
+_TYPES = {
+    pa.string(): pd.StringDtype("pyarrow"),
+    pa.large_string(): pd.StringDtype("pyarrow"),
+}
+
+# Attached blocks stay open while frames read from them are alive; blocks
+# replaced by a newer publish are closed once their frames are released
+_attached: dict[str, shared_memory.SharedMemory] = {}
+_retired: list[shared_memory.SharedMemory] = []
+_lock = threading.Lock()
+
+
+def _retire(block: shared_memory.SharedMemory) -> None:
+    _retired.append(block)
+    still_open = []
+    for segment in _retired:
+        try:
+            segment.close()
+        except BufferError:
+            still_open.append(segment)
+    _retired[:] = still_open
+
+
+def _untrack(block: shared_memory.SharedMemory) -> None:
+    """Stop this process's resource tracker from unlinking the block at exit"""
+    if os.name == "posix":
+        resource_tracker.unregister(block._name, "shared_memory")
+
+
+def _unlink(name: str) -> None:
+    try:
+        block = shared_memory.SharedMemory(name=_PREFIX + name)
+    except FileNotFoundError:
+        return
+    block.close()
+    try:
+        # unlink() also unregisters the block from the tracker
+        block.unlink()
+    except FileNotFoundError:
+        _untrack(block)
+
+
+def _free_space(size: int) -> bool:
+    """Whether tmpfs can back `size` more bytes; writing past its limit raises SIGBUS"""
+    if not os.path.isdir(_SHM_DIR):
+        return True
+    return shutil.disk_usage(_SHM_DIR).free > size
+
+
+def read_frame(name: str, max_age: float) -> Optional[tuple[pd.DataFrame, float]]:
+    """Frame published under `name` by any worker and its publish time (epoch seconds),
+    or None if absent, unfinished or older than `max_age`"""
+    try:
+        block = shared_memory.SharedMemory(name=_PREFIX + name)
+    except FileNotFoundError:
+        return None
+    _untrack(block)
+
+    payload = None
+    try:
+        length, published = _HEADER.unpack_from(block.buf)
+        if length == 0:
+            block.close()
+            return None
+        if time.time() - published > max_age:
+            block.close()
+            _unlink(name)
+            return None
+
+        payload = pa.py_buffer(block.buf[_HEADER.size:_HEADER.size + length])
+        frame = pa.ipc.open_stream(payload).read_all().to_pandas(types_mapper=_TYPES.get)
+    except BaseException:
+        payload = None
+        with _lock:
+            _retire(block)
+        raise
+
+    with _lock:
+        previous = _attached.pop(name, None)
+        _attached[name] = block
+        if previous is not None:
+            _retire(previous)
+    return frame, published
+
+
+def publish_frame(name: str, frame: pd.DataFrame) -> bool:
+    """Publish a frame for other workers. Returns False, publishing nothing, if
+    one is already published under `name` or shared memory lacks the space."""
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    payload = sink.getvalue()
+    size = _HEADER.size + payload.size
+
+    if not _free_space(size):
+        return False
+
+    try:
+        block = shared_memory.SharedMemory(name=_PREFIX + name, create=True, size=size)
+    except FileExistsError:
+        return False
+
+    try:
+        # Payload first: the header's non-zero length marks the block as ready
+        # pyarrow buffers export signed bytes ('b'); the block's view is 'B'
+        block.buf[_HEADER.size:_HEADER.size + payload.size] = memoryview(payload).cast('B')
+        _HEADER.pack_into(block.buf, 0, payload.size, time.time())
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    _untrack(block)
+    block.close()
+    return True
+
+
+def discard_frame(name: str) -> None:
+    """Remove a published frame so the next miss fetches fresh data"""
+    _unlink(name)
+    with _lock:
+        block = _attached.pop(name, None)
+        if block is not None:
+            _retire(block)
@@ -0,0 +1,83 @@
+"""
+Numba-compiled statistics kernels for the Diabetes Care API.
+
+GP-level requests summarise thousands of values per call; these kernels
+do the work in a couple of compiled passes instead of one pandas call per
+statistic. `cache=True` keeps the compiled code on disk between restarts.
+Inputs must be float64 arrays with missing values already removed.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _quantile_sorted(sorted_values, q):
+    """Linear-interpolated quantile of an ascending array (pandas' default method)"""
+    position = q * (sorted_values.shape[0] - 1)
+    lower = int(np.floor(position))
+    upper = min(lower + 1, sorted_values.shape[0] - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+@njit(cache=True, fastmath=True)
+def summary(values):
+    """Return (mean, std, min, p25, median, p75, max); std uses ddof=1 like pandas"""
+    n = values.shape[0]
+    if n == 0:
+        return np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan
+
+    sorted_values = np.sort(values)
+
+    total = 0.0
+    for i in range(n):
+        total += sorted_values[i]
+    mean = total / n
+
+    std = np.nan
+    if n > 1:
+        squares = 0.0
+        for i in range(n):
+            deviation = sorted_values[i] - mean
+            squares += deviation * deviation
+        std = np.sqrt(squares / (n - 1))
+
+    return (
+        mean,
+        std,
+        sorted_values[0],
+        _quantile_sorted(sorted_values, 0.25),
+        _quantile_sorted(sorted_values, 0.5),
+        _quantile_sorted(sorted_values, 0.75),
+        sorted_values[n - 1],
+    )
+
+
+@njit(cache=True, fastmath=True)
+def pearson(x, y):
+    """Pearson correlation of two equal-length arrays, clamped to [-1, 1]; NaN if either is constant"""
+    n = x.shape[0]
+    x_mean = 0.0
+    y_mean = 0.0
+    for i in range(n):
+        x_mean += x[i]
+        y_mean += y[i]
+    x_mean /= n
+    y_mean /= n
+
+    xy = 0.0
+    xx = 0.0
+    yy = 0.0
+    for i in range(n):
+        dx = x[i] - x_mean
+        dy = y[i] - y_mean
+        xy += dx * dy
+        xx += dx * dx
+        yy += dy * dy
+
+    if xx == 0.0 or yy == 0.0:
+        return np.nan
+
+    r = xy / np.sqrt(xx * yy)
+    return max(min(r, 1.0), -1.0)
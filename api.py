@@ -12,25 +12,67 @@ Docs at:
 
 from fastapi import FastAPI, Query, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Optional, Literal
 from enum import Enum
 import fingertips_py as ftp
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import geopandas as gpd
+import httpx
+import orjson
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.collections import PolyCollection
+from PIL import Image
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from scipy import stats
+from _stats_numba import summary, pearson
+from _shared_cache import read_frame, publish_frame, discard_frame
 import io
-import base64
+import os
+from pathlib import Path
+import pybase64
+import asyncio
+import threading
+import weakref
+import time
+import logging
+from contextlib import asynccontextmanager, suppress
+from cachetools import TLRUCache, TTLCache, cached
+
+
+logger = logging.getLogger(__name__)
 
 
 # =============================================================================
 # App Setup
 # =============================================================================
 
+class NumpyJSONResponse(Response):
+    """JSON rendered by orjson, which serializes numpy values natively (NaN becomes null)"""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open one pooled HTTP/2 client for the app's lifetime and warm the boundaries cache"""
+    async with httpx.AsyncClient(http2=True, timeout=30) as client:
+        app.state.http = client
+        # Only from disk: a cold start should not wait on (or fail with) ArcGIS
+        if BOUNDARIES_PATH.exists():
+            await load_boundaries()
+        yield
+
+
 app = FastAPI(
     title="Diabetes Care API",
     description="""
@@ -55,7 +97,9 @@ Analyze diabetes care quality across NHS regions in England.
 - `ICB sub-locations` - Sub-regions
 - `GPs` - Individual GP practices
     """,
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=NumpyJSONResponse,
+    lifespan=lifespan
 )
 
 # Enable CORS for all origins
@@ -114,30 +158,333 @@ INDICATOR_INFO = {
     94153: {"name": "Type 2 - Statin prescription", "description": "% prescribed statins for heart disease prevention"},
 }
 
-# ICB boundaries URL
+# Lookups built once at import rather than per request
+_INDICATOR_INFO_TUPLE = tuple((k, v["name"], v["description"]) for k, v in INDICATOR_INFO.items())
+_INDICATOR_BY_ID: dict[IndicatorID, dict] = {IndicatorID(k): v for k, v in INDICATOR_INFO.items()}
+
+# /data record fields, keyed by source column
+_RECORD_FIELDS = {
+    'Area Code': 'area_code',
+    'Area Name': 'area_name',
+    'Value': 'value',
+    'Count': 'count',
+    'Denominator': 'denominator',
+}
+
+# Leading "indicator" / "area_type" fields shared by the analysis responses
+_PREAMBLES: dict[tuple[IndicatorID, AreaType], dict] = {
+    (indicator, area): {"indicator": _INDICATOR_BY_ID[indicator], "area_type": area.value}
+    for indicator in IndicatorID
+    for area in AreaType
+}
+
+# ICB boundaries URL, and the local GeoParquet copy loaded instead after the first download
 BOUNDARIES_URL = "https://services1.arcgis.com/ESMARspQHYMw9BZ9/arcgis/rest/services/Integrated_Care_Boards_April_2023_EN_BGC/FeatureServer/0/query?where=1%3D1&outFields=*&outSR=4326&f=geojson"
+BOUNDARIES_PATH = Path(__file__).with_name("icb_2023.parquet")
+
+# Caches: size-capped and expiring, so long-running workers stay bounded
+# and pick up upstream data updates. The caches are not thread-safe, hence the lock.
+CACHE_TTL = 3600
 
-# Cache
-_cache = {}
+# When each indicator's data expires (epoch seconds). A frame read from
+# another worker expires when the publisher's copy does, not CACHE_TTL later.
+_indicator_deadlines: dict[int, float] = {}
+
+
+def _indicator_expiry(key: tuple, value, now: float) -> float:
+    """Entries keyed (kind, indicator_id, ...) expire no later than that indicator's data"""
+    return min(now + CACHE_TTL, _indicator_deadlines.get(key[1], now + CACHE_TTL))
+
+
+_cache = TLRUCache(maxsize=64, ttu=_indicator_expiry, timer=time.time)
+_boundaries_cache = TTLCache(maxsize=2, ttl=CACHE_TTL)
+_arrays_cache = TLRUCache(maxsize=256, ttu=_indicator_expiry, timer=time.time)
+# Map values per (indicator, period, boundary rings), kept apart from _cache so
+# they never evict indicator frames
+_map_values_cache = TLRUCache(maxsize=128, ttu=_indicator_expiry, timer=time.time)
+_cache_lock = threading.RLock()
+
+# Rendered map PNGs, expiring with the indicator data they were drawn from
+MAP_PNG_CACHE_SIZE = 32
+MAP_PNG_CACHE_BYTES = 64 * 1024 * 1024
+_map_png_cache = TLRUCache(maxsize=MAP_PNG_CACHE_SIZE, ttu=_indicator_expiry, timer=time.time)
+_map_png_lock = threading.Lock()
+
+# Figures reused across requests, per worker thread and (width, height, dpi).
+# A pooled figure keeps its Agg buffer (4 bytes per pixel) allocated, so only
+# default-sized figures are pooled, and only POOLED_FIGURES across all threads.
+POOLED_FIGURE_PIXELS = 1_500_000
+POOLED_FIGURES = 8
+_figures = threading.local()
+_pooled_figures = 0
+_pooled_figures_lock = threading.Lock()
+
+# zlib level for chart and map PNGs. Level 1 encodes faster but made large
+# figures about 4x bigger (844 KB vs 200 KB for a 20x24in map at 300 dpi);
+# 6 is zlib's default, which savefig also uses.
+PNG_COMPRESS_LEVEL = 6
+
+# One lock per cache key, so concurrent misses share a single fetch
+_cache_locks: dict[str, asyncio.Lock] = {}
 
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
+@cached(_cache, key=lambda indicator_id: ("indicator", indicator_id), lock=_cache_lock, info=True)
 def get_indicator_data(indicator_id: int) -> pd.DataFrame:
-    """Fetch indicator data from Fingertips API (cached)"""
-    cache_key = f"indicator_{indicator_id}"
-    if cache_key not in _cache:
-        _cache[cache_key] = ftp.get_data_for_indicator_at_all_available_geographies(indicator_id)
-    return _cache[cache_key]
+    """Fetch indicator data from Fingertips API (cached, and shared across workers)"""
+    # Sharing is an optimisation only: any failure falls back to a local fetch
+    shared_name = f"indicator_{indicator_id}"
+    try:
+        shared = read_frame(shared_name, max_age=CACHE_TTL)
+    except Exception:
+        logger.warning("Could not read shared frame %s", shared_name, exc_info=True)
+        shared = None
+
+    if shared is not None:
+        data, published = shared
+        _indicator_deadlines[indicator_id] = published + CACHE_TTL
+        return data
+
+    data = ftp.get_data_for_indicator_at_all_available_geographies(indicator_id)
+
+    # Arrow-backed strings and Int32 counts: less memory, and string
+    # comparisons run as Arrow kernels instead of object loops. Value stays
+    # float64: float32 cannot hold e.g. 80.1 exactly, which breaks the
+    # min/max filters and two-decimal rounding.
+    for column in ['Area Type', 'Area Name', 'Time period', 'Area Code']:
+        data[column] = data[column].astype('string[pyarrow]')
+    data[['Count', 'Denominator']] = data[['Count', 'Denominator']].round().astype('Int32')
+
+    _indicator_deadlines[indicator_id] = time.time() + CACHE_TTL
+    try:
+        publish_frame(shared_name, data)
+    except Exception:
+        logger.warning("Could not publish shared frame %s", shared_name, exc_info=True)
+    return data
+
+
+@cached(_cache, key=lambda indicator_id: ("indexed", indicator_id), lock=_cache_lock)
+def get_indicator_index(indicator_id: int) -> tuple[dict, dict]:
+    """Indicator frames keyed by (area type, time period), plus latest period per area type"""
+    data = get_indicator_data(indicator_id)
+
+    # Index once so filter_data is a dict lookup instead of two mask scans
+    indexed = {
+        key: group for key, group in data.groupby(['Area Type', 'Time period'], sort=False)
+    }
+    latest = data.groupby('Area Type')['Time period'].max().to_dict()
+    return indexed, latest
+
 
+def get_boundary_rings(boundaries: gpd.GeoDataFrame) -> tuple[list, np.ndarray, float, int]:
+    """Exterior ring vertices of every ICB polygon, the ICB code of each ring,
+    the plot aspect for the boundaries' latitude, and a token identifying the
+    ring order for keying anything aligned to it (cached)"""
+    with _cache_lock:
+        rings = _boundaries_cache.get("rings")
+    if rings is not None:
+        return rings
 
-def get_boundaries() -> gpd.GeoDataFrame:
-    """Fetch ICB geographic boundaries (cached)"""
-    if "boundaries" not in _cache:
-        _cache["boundaries"] = gpd.read_file(BOUNDARIES_URL)
-    return _cache["boundaries"]
+    verts, codes = [], []
+    for code, geom in zip(boundaries['ICB23CD'], boundaries.geometry):
+        polygons = geom.geoms if geom.geom_type == 'MultiPolygon' else [geom]
+        for polygon in polygons:
+            verts.append(np.asarray(polygon.exterior.coords))
+            codes.append(code)
+
+    # Same correction GeoPandas applies to lon/lat data
+    _, ymin, _, ymax = boundaries.total_bounds
+    aspect = 1 / np.cos(np.radians((ymin + ymax) / 2))
+
+    rings = (verts, np.array(codes, dtype=object), aspect, hash(tuple(codes)))
+    with _cache_lock:
+        _boundaries_cache["rings"] = rings
+    return rings
+
+
+def get_map_values(
+    indicator_id: int,
+    ring_codes: np.ndarray,
+    rings_token: int,
+    time_period: Optional[str] = None
+) -> tuple[np.ndarray, str]:
+    """Indicator value for each boundary ring, NaN where an ICB has no data (cached)"""
+    df, period = filter_data(indicator_id, "ICBs", time_period)
+    # Keyed by ring order too, so reloaded boundaries never get misaligned values
+    cache_key = ("map", indicator_id, period, rings_token)
+    with _cache_lock:
+        values = _map_values_cache.get(cache_key)
+
+    if values is None:
+        positions = pd.Index(df['Area Code'].to_numpy(dtype=object)).get_indexer(ring_codes)
+        area_values = df['Value'].to_numpy(dtype=np.float64)
+        values = np.where(positions >= 0, area_values[positions], np.nan)
+        values.setflags(write=False)
+        with _cache_lock:
+            _map_values_cache[cache_key] = values
+    return values, period
+
+
+def get_area_arrays(
+    indicator_id: int,
+    area_type: str,
+    time_period: Optional[str] = None
+) -> tuple[dict, str]:
+    """Column arrays and summary statistics for one indicator slice (cached)
+
+    `codes`, `names`, `values` and `denominators` cover the areas that have a
+    value; the `paired_*` arrays additionally require a denominator.
+    """
+    df, period = filter_data(indicator_id, area_type, time_period)
+    cache_key = ("arrays", indicator_id, area_type, period)
+    with _cache_lock:
+        arrays = _arrays_cache.get(cache_key)
+    if arrays is not None:
+        return arrays, period
+
+    values = df['Value'].to_numpy(dtype=np.float64)
+    denominators = df['Denominator'].to_numpy(dtype=np.float64, na_value=np.nan)
+    has_value = ~np.isnan(values)
+    values = values[has_value]
+    area_denominators = denominators[has_value]
+    paired = ~np.isnan(area_denominators)
+
+    arrays = {
+        "codes": df['Area Code'].to_numpy(dtype=object, na_value=None)[has_value],
+        "names": df['Area Name'].to_numpy(dtype=object, na_value=None)[has_value],
+        "values": values,
+        "denominators": area_denominators,
+        "paired_values": values[paired],
+        "paired_denominators": area_denominators[paired],
+        "total_patients": int(np.nansum(denominators)),
+        "summary": summary(values),
+    }
+    # Shared between requests like the frames they come from
+    for array in arrays.values():
+        if isinstance(array, np.ndarray):
+            array.setflags(write=False)
+
+    with _cache_lock:
+        _arrays_cache[cache_key] = arrays
+    return arrays, period
+
+
+def _release_pooled_figure() -> None:
+    global _pooled_figures
+    with _pooled_figures_lock:
+        _pooled_figures -= 1
+
+
+def get_figure(width: float, height: float, dpi: int) -> Figure:
+    """Cleared figure for this thread, reused instead of allocating one per request
+    when it is small enough to pool; larger figures are freed after use"""
+    global _pooled_figures
+    pool = getattr(_figures, "pool", None)
+    if pool is None:
+        pool = _figures.pool = {}
+
+    key = (width, height, dpi)
+    fig = pool.get(key)
+    if fig is not None:
+        fig.clear()
+        return fig
+
+    fig = Figure(figsize=(width, height), dpi=dpi)
+    FigureCanvasAgg(fig)
+
+    if width * height * dpi * dpi <= POOLED_FIGURE_PIXELS:
+        with _pooled_figures_lock:
+            if _pooled_figures < POOLED_FIGURES:
+                _pooled_figures += 1
+                pool[key] = fig
+                # Free the slot when the thread exits and its pool is collected
+                weakref.finalize(fig, _release_pooled_figure)
+    return fig
+
+
+def encode_png(fig: Figure) -> io.BytesIO:
+    """Draw the figure on its Agg canvas and PNG-encode the pixels with Pillow
+
+    Matches savefig(bbox_inches='tight') without its second draw: the margins
+    are cropped from the drawn buffer, and an opaque figure is encoded as RGB.
+    """
+    fig.canvas.draw()
+    pixels = np.asarray(fig.canvas.buffer_rgba())
+
+    # Crop to the artists plus savefig's default 0.1in padding
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+    height, width = pixels.shape[:2]
+    dpi = fig.dpi
+    left = max(int(np.floor(bbox.x0 * dpi)), 0)
+    right = min(int(np.ceil(bbox.x1 * dpi)), width)
+    top = max(int(np.floor(height - bbox.y1 * dpi)), 0)
+    bottom = min(int(np.ceil(height - bbox.y0 * dpi)), height)
+    pixels = pixels[top:bottom, left:right]
+
+    if fig.patch.get_visible() and fig.get_facecolor()[3] == 1:
+        pixels = pixels[..., :3]
+
+    buf = io.BytesIO()
+    image = Image.fromarray(np.ascontiguousarray(pixels))
+    image.save(buf, format='PNG', optimize=False, compress_level=PNG_COMPRESS_LEVEL)
+    buf.seek(0)
+    return buf
+
+
+async def load_indicator_data(indicator_id: int) -> pd.DataFrame:
+    """Fetch indicator data in the threadpool, one download per indicator"""
+    cache_key = ("indicator", indicator_id)
+    with _cache_lock:
+        data = _cache.get(cache_key)
+
+    if data is None:
+        async with _cache_locks.setdefault(f"indicator_{indicator_id}", asyncio.Lock()):
+            data = await run_in_threadpool(get_indicator_data, indicator_id)
+    return data
+
+
+def save_boundaries(gdf: gpd.GeoDataFrame) -> None:
+    """Write boundaries to GeoParquet atomically, so concurrent workers never read a partial file
+
+    The disk copy is optional: if it cannot be written (e.g. a read-only app
+    directory) the failure is logged and the boundaries are only held in memory.
+    """
+    tmp_path = BOUNDARIES_PATH.with_name(f"{BOUNDARIES_PATH.name}.{os.getpid()}.tmp")
+    try:
+        gdf.to_parquet(tmp_path)
+        os.replace(tmp_path, BOUNDARIES_PATH)
+    except OSError:
+        logger.warning("Could not save boundaries to %s", BOUNDARIES_PATH, exc_info=True)
+        with suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+
+
+async def load_boundaries() -> gpd.GeoDataFrame:
+    """Load ICB boundaries from the local GeoParquet copy, downloading it on first use (cached)"""
+    with _cache_lock:
+        gdf = _boundaries_cache.get("boundaries")
+    if gdf is not None:
+        return gdf
+
+    async with _cache_locks.setdefault("boundaries", asyncio.Lock()):
+        # A request that waited on the lock finds the first one's result
+        with _cache_lock:
+            gdf = _boundaries_cache.get("boundaries")
+        if gdf is None:
+            if BOUNDARIES_PATH.exists():
+                gdf = await run_in_threadpool(gpd.read_parquet, BOUNDARIES_PATH)
+            else:
+                response = await app.state.http.get(BOUNDARIES_URL)
+                response.raise_for_status()
+                gdf = await run_in_threadpool(gpd.read_file, io.BytesIO(response.content))
+                await run_in_threadpool(save_boundaries, gdf)
+            with _cache_lock:
+                _boundaries_cache["boundaries"] = gdf
+                _boundaries_cache.pop("rings", None)
+    return gdf
 
 
 def filter_data(
@@ -145,19 +492,23 @@ def filter_data(
     area_type: str,
     time_period: Optional[str] = None
 ) -> pd.DataFrame:
-    """Filter indicator data by area type and time period"""
-    data = get_indicator_data(indicator_id)
-    df = data[data['Area Type'] == area_type].copy()
+    """Filter indicator data by area type and time period
 
-    if df.empty:
+    The frame returned is shared with the cache, not copied: callers derive
+    new frames or arrays from it (filter, sort, to_numpy) and must not
+    modify it in place.
+    """
+    indexed, latest = get_indicator_index(indicator_id)
+
+    if area_type not in latest:
         raise HTTPException(status_code=404, detail=f"No data for area type '{area_type}'")
 
     if time_period is None:
-        time_period = df['Time period'].max()
+        time_period = latest[area_type]
 
-    df = df[df['Time period'] == time_period].copy()
+    df = indexed.get((area_type, time_period))
 
-    if df.empty:
+    if df is None:
         raise HTTPException(status_code=404, detail=f"No data for time period '{time_period}'")
 
     return df, time_period
@@ -166,57 +517,69 @@ def filter_data(
 # =============================================================================
 # Endpoints
 # =============================================================================
+#
+# Handlers that touch pandas or matplotlib are `async def` and hand the
+# blocking work to the threadpool, so the event loop stays free to accept
+# other requests while a frame is filtered or a figure is rendered.
+
+# Static responses, serialized once at import
+_ROOT_JSON = orjson.dumps({
+    "name": "Diabetes Care API",
+    "docs": "/docs",
+    "endpoints": ["/indicators", "/data", "/summary", "/rankings", "/correlation", "/map", "/chart"]
+})
+
+_INDICATOR_LIST = [
+    {"id": k, "name": name, "description": description}
+    for k, name, description in _INDICATOR_INFO_TUPLE
+]
+_INDICATOR_LIST_JSON = orjson.dumps(_INDICATOR_LIST)
+
 
 @app.get("/", tags=["Info"])
 def root():
     """API info and available endpoints"""
-    return {
-        "name": "Diabetes Care API",
-        "docs": "/docs",
-        "endpoints": ["/indicators", "/data", "/summary", "/rankings", "/correlation", "/map", "/chart"]
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 
 @app.get("/indicators", tags=["Reference"])
 def list_indicators():
     """List all available diabetes indicators"""
-    return [
-        {"id": k, "name": v["name"], "description": v["description"]}
-        for k, v in INDICATOR_INFO.items()
-    ]
+    return Response(content=_INDICATOR_LIST_JSON, media_type="application/json")
 
 
-@app.get("/time-periods", tags=["Reference"])
-def list_time_periods(
-    indicator_id: IndicatorID = Query(IndicatorID.TYPE1_9_CARE_PROCESSES, description="Indicator ID"),
-    area_type: AreaType = Query(AreaType.ICBS, description="Area type")
-):
-    """List available time periods for an indicator"""
-    data = get_indicator_data(indicator_id.value)
-    df = data[data['Area Type'] == area_type.value]
-    periods = sorted(df['Time period'].unique().tolist(), reverse=True)
+def _list_time_periods(indicator_id: IndicatorID, area_type: AreaType) -> dict:
+    indexed, _ = get_indicator_index(indicator_id.value)
+    periods = sorted((tp for at, tp in indexed if at == area_type.value), reverse=True)
     return {"time_periods": periods, "latest": periods[0] if periods else None}
 
 
-@app.get("/data", tags=["Data"])
-def get_data(
+@app.get("/time-periods", tags=["Reference"])
+async def list_time_periods(
     indicator_id: IndicatorID = Query(IndicatorID.TYPE1_9_CARE_PROCESSES, description="Indicator ID"),
-    area_type: AreaType = Query(AreaType.ICBS, description="Area type"),
-    time_period: Optional[str] = Query(None, description="Time period (e.g. '2023/24'). Defaults to latest."),
-    area_name_contains: Optional[str] = Query(None, description="Filter by area name (case-insensitive)"),
-    min_value: Optional[float] = Query(None, ge=0, le=100, description="Minimum value filter"),
-    max_value: Optional[float] = Query(None, ge=0, le=100, description="Maximum value filter"),
-    limit: Optional[int] = Query(None, ge=1, le=10000, description="Limit results")
+    area_type: AreaType = Query(AreaType.ICBS, description="Area type")
 ):
-    """
-    Get diabetes indicator data with filtering options.
-
-    Returns raw data for the selected indicator, area type, and time period.
-    """
+    """List available time periods for an indicator"""
+    await load_indicator_data(indicator_id.value)
+    return await run_in_threadpool(_list_time_periods, indicator_id, area_type)
+
+
+def _get_data(
+    indicator_id: IndicatorID,
+    area_type: AreaType,
+    time_period: Optional[str],
+    area_name_contains: Optional[str],
+    min_value: Optional[float],
+    max_value: Optional[float],
+    limit: Optional[int]
+) -> NumpyJSONResponse:
     df, period = filter_data(indicator_id.value, area_type.value, time_period)
 
     if area_name_contains:
-        df = df[df['Area Name'].str.contains(area_name_contains, case=False, na=False)]
+        # Case-insensitive substring match with Arrow's string kernel, no regex
+        names = pa.array(df['Area Name'].array)
+        matches = pc.match_substring(names, area_name_contains, ignore_case=True)
+        df = df[np.asarray(pc.fill_null(matches, False), dtype=bool)]
 
     if min_value is not None:
         df = df[df['Value'] >= min_value]
@@ -229,117 +592,176 @@ def get_data(
     if limit:
         df = df.head(limit)
 
-    records = df.apply(lambda row: {
-        "area_code": row['Area Code'],
-        "area_name": row['Area Name'],
-        "value": round(row['Value'], 2) if pd.notna(row['Value']) else None,
-        "count": int(row['Count']) if pd.notna(row['Count']) else None,
-        "denominator": int(row['Denominator']) if pd.notna(row['Denominator']) else None,
-    }, axis=1).tolist()
+    columns = df[list(_RECORD_FIELDS)]
 
-    return {
-        "indicator": INDICATOR_INFO[indicator_id.value],
-        "area_type": area_type.value,
+    if not columns.isna().to_numpy().any():
+        # Nothing to coerce to null, so pandas can build the records itself
+        columns = columns.rename(columns=_RECORD_FIELDS)
+        columns['value'] = columns['value'].astype(np.float64).round(2)
+        records = columns.to_dict(orient='records')
+    else:
+        # Build records from column arrays rather than a per-row apply
+        codes = df['Area Code'].to_numpy(dtype=object, na_value=None)
+        names = df['Area Name'].to_numpy(dtype=object, na_value=None)
+        values = np.round(df['Value'].to_numpy(dtype=np.float64), 2)
+        counts = df['Count'].to_numpy(dtype=np.float64, na_value=np.nan)
+        denominators = df['Denominator'].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        records = [
+            {
+                "area_code": code,
+                "area_name": name,
+                "value": value,
+                "count": None if cnt != cnt else int(cnt),
+                "denominator": None if den != den else int(den),
+            }
+            for code, name, value, cnt, den in zip(codes, names, values, counts, denominators)
+        ]
+
+    # Returned as a response so orjson serializes the numpy values directly
+    # (NaN becomes null) instead of going through jsonable_encoder first
+    return NumpyJSONResponse({
+        **_PREAMBLES[indicator_id, area_type],
         "time_period": period,
         "count": len(records),
         "data": records
-    }
+    })
 
 
-@app.get("/summary", tags=["Analysis"])
-def get_summary(
+@app.get("/data", tags=["Data"])
+async def get_data(
     indicator_id: IndicatorID = Query(IndicatorID.TYPE1_9_CARE_PROCESSES, description="Indicator ID"),
     area_type: AreaType = Query(AreaType.ICBS, description="Area type"),
-    time_period: Optional[str] = Query(None, description="Time period. Defaults to latest.")
+    time_period: Optional[str] = Query(None, description="Time period (e.g. '2023/24'). Defaults to latest."),
+    area_name_contains: Optional[str] = Query(None, description="Filter by area name (case-insensitive)"),
+    min_value: Optional[float] = Query(None, ge=0, le=100, description="Minimum value filter"),
+    max_value: Optional[float] = Query(None, ge=0, le=100, description="Maximum value filter"),
+    limit: Optional[int] = Query(None, ge=1, le=10000, description="Limit results")
 ):
     """
-    Get statistical summary of indicator values.
+    Get diabetes indicator data with filtering options.
 
-    Returns mean, std, min, max, and percentiles.
+    Returns raw data for the selected indicator, area type, and time period.
     """
-    df, period = filter_data(indicator_id.value, area_type.value, time_period)
-    values = df['Value'].dropna()
+    await load_indicator_data(indicator_id.value)
+    return await run_in_threadpool(
+        _get_data, indicator_id, area_type, time_period,
+        area_name_contains, min_value, max_value, limit
+    )
+
+
+def _get_summary(indicator_id: IndicatorID, area_type: AreaType, time_period: Optional[str]) -> dict:
+    arrays, period = get_area_arrays(indicator_id.value, area_type.value, time_period)
+    mean, std, minimum, p25, median, p75, maximum = arrays["summary"]
 
     return {
-        "indicator": INDICATOR_INFO[indicator_id.value],
-        "area_type": area_type.value,
+        **_PREAMBLES[indicator_id, area_type],
         "time_period": period,
-        "areas_count": len(values),
-        "total_patients": int(df['Denominator'].sum()) if 'Denominator' in df.columns else None,
+        "areas_count": len(arrays["values"]),
+        "total_patients": arrays["total_patients"],
         "statistics": {
-            "mean": round(values.mean(), 2),
-            "std": round(values.std(), 2),
-            "min": round(values.min(), 2),
-            "percentile_25": round(values.quantile(0.25), 2),
-            "median": round(values.median(), 2),
-            "percentile_75": round(values.quantile(0.75), 2),
-            "max": round(values.max(), 2),
+            "mean": round(mean, 2),
+            "std": round(std, 2),
+            "min": round(minimum, 2),
+            "percentile_25": round(p25, 2),
+            "median": round(median, 2),
+            "percentile_75": round(p75, 2),
+            "max": round(maximum, 2),
         }
     }
 
 
-@app.get("/rankings", tags=["Analysis"])
-def get_rankings(
+@app.get("/summary", tags=["Analysis"])
+async def get_summary(
     indicator_id: IndicatorID = Query(IndicatorID.TYPE1_9_CARE_PROCESSES, description="Indicator ID"),
     area_type: AreaType = Query(AreaType.ICBS, description="Area type"),
-    time_period: Optional[str] = Query(None, description="Time period. Defaults to latest."),
-    n: int = Query(10, ge=1, le=100, description="Number of top/bottom areas to return"),
-    order: Literal["top", "bottom"] = Query("top", description="Return top or bottom performers")
+    time_period: Optional[str] = Query(None, description="Time period. Defaults to latest.")
 ):
     """
-    Get top or bottom performing areas.
+    Get statistical summary of indicator values.
 
-    Use `order=top` for best performers, `order=bottom` for worst.
+    Returns mean, std, min, max, and percentiles.
     """
-    df, period = filter_data(indicator_id.value, area_type.value, time_period)
-    df = df.dropna(subset=['Value'])
-
-    if order == "top":
-        df = df.nlargest(n, 'Value')
+    await load_indicator_data(indicator_id.value)
+    return await run_in_threadpool(_get_summary, indicator_id, area_type, time_period)
+
+
+def _get_rankings(
+    indicator_id: IndicatorID,
+    area_type: AreaType,
+    time_period: Optional[str],
+    n: int,
+    order: str
+) -> dict:
+    arrays, period = get_area_arrays(indicator_id.value, area_type.value, time_period)
+    values = arrays["values"]
+
+    # Find the n-th best value in O(N), then sort only the areas that reach it.
+    # Candidates stay in row order and the sort is stable, so ties keep the
+    # earliest rows, as nlargest/nsmallest with keep='first' do.
+    key = -values if order == "top" else values
+    if n >= len(key):
+        idx = np.arange(len(key))
     else:
-        df = df.nsmallest(n, 'Value')
+        threshold = np.partition(key, n - 1)[n - 1]
+        idx = np.flatnonzero(key <= threshold)
+    idx = idx[np.argsort(key[idx], kind="stable")][:n]
 
-    rankings = []
-    for rank, (_, row) in enumerate(df.iterrows(), 1):
-        rankings.append({
+    codes = arrays["codes"][idx]
+    names = arrays["names"][idx]
+    rounded = np.round(values[idx], 2).tolist()
+    denominators = arrays["denominators"][idx].tolist()
+
+    rankings = [
+        {
             "rank": rank,
-            "area_code": row['Area Code'],
-            "area_name": row['Area Name'],
-            "value": round(row['Value'], 2),
-            "patient_count": int(row['Denominator']) if pd.notna(row['Denominator']) else None
-        })
+            "area_code": code,
+            "area_name": name,
+            "value": value,
+            "patient_count": None if den != den else int(den)
+        }
+        for rank, (code, name, value, den) in enumerate(zip(codes, names, rounded, denominators), 1)
+    ]
 
     return {
-        "indicator": INDICATOR_INFO[indicator_id.value],
-        "area_type": area_type.value,
+        **_PREAMBLES[indicator_id, area_type],
         "time_period": period,
         "order": order,
         "rankings": rankings
     }
 
 
-@app.get("/correlation", tags=["Analysis"])
-def get_correlation(
+@app.get("/rankings", tags=["Analysis"])
+async def get_rankings(
     indicator_id: IndicatorID = Query(IndicatorID.TYPE1_9_CARE_PROCESSES, description="Indicator ID"),
     area_type: AreaType = Query(AreaType.ICBS, description="Area type"),
-    time_period: Optional[str] = Query(None, description="Time period. Defaults to latest.")
+    time_period: Optional[str] = Query(None, description="Time period. Defaults to latest."),
+    n: int = Query(10, ge=1, le=100, description="Number of top/bottom areas to return"),
+    order: Literal["top", "bottom"] = Query("top", description="Return top or bottom performers")
 ):
     """
-    Analyze correlation between population size and care quality.
+    Get top or bottom performing areas.
 
-    Tests whether larger areas have better or worse outcomes.
+    Use `order=top` for best performers, `order=bottom` for worst.
     """
-    df, period = filter_data(indicator_id.value, area_type.value, time_period)
+    await load_indicator_data(indicator_id.value)
+    return await run_in_threadpool(_get_rankings, indicator_id, area_type, time_period, n, order)
 
-    df = df.dropna(subset=['Value', 'Denominator'])
 
-    if len(df) < 3:
-        raise HTTPException(status_code=400, detail="Insufficient data for correlation analysis")
+def _get_correlation(indicator_id: IndicatorID, area_type: AreaType, time_period: Optional[str]) -> dict:
+    arrays, period = get_area_arrays(indicator_id.value, area_type.value, time_period)
+    x = arrays["paired_denominators"]
+    y = arrays["paired_values"]
+    n = len(x)
 
-    x = df['Denominator']
-    y = df['Value']
+    if n < 3:
+        raise HTTPException(status_code=400, detail="Insufficient data for correlation analysis")
 
-    r, p = stats.pearsonr(x, y)
+    # Pearson r and its two-sided p-value, without pearsonr's validation overhead
+    r = pearson(x, y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = r * np.sqrt((n - 2) / (1 - r * r))
+    p = float(2 * stats.t.sf(abs(t), n - 2))
 
     if p >= 0.05:
         interpretation = "No significant relationship between population size and care quality."
@@ -351,8 +773,7 @@ def get_correlation(
         interpretation = "Weak relationship between population size and care quality."
 
     return {
-        "indicator": INDICATOR_INFO[indicator_id.value],
-        "area_type": area_type.value,
+        **_PREAMBLES[indicator_id, area_type],
         "time_period": period,
         "correlation": {
             "r": round(r, 4),
@@ -363,97 +784,135 @@ def get_correlation(
     }
 
 
-@app.get("/map", tags=["Visualization"])
-def generate_map(
+@app.get("/correlation", tags=["Analysis"])
+async def get_correlation(
     indicator_id: IndicatorID = Query(IndicatorID.TYPE1_9_CARE_PROCESSES, description="Indicator ID"),
-    time_period: Optional[str] = Query(None, description="Time period. Defaults to latest."),
-    cmap: ColorMap = Query(ColorMap.RdYlGn, description="Color scheme"),
-    figsize_width: float = Query(10, ge=5, le=20, description="Figure width in inches"),
-    figsize_height: float = Query(12, ge=5, le=24, description="Figure height in inches"),
-    dpi: int = Query(100, ge=50, le=300, description="Resolution (DPI)"),
-    title: Optional[str] = Query(None, description="Custom title"),
-    format: Literal["png", "base64"] = Query("png", description="Output format")
+    area_type: AreaType = Query(AreaType.ICBS, description="Area type"),
+    time_period: Optional[str] = Query(None, description="Time period. Defaults to latest.")
 ):
     """
-    Generate a choropleth map of ICB areas.
+    Analyze correlation between population size and care quality.
 
-    Returns a PNG image showing geographic distribution of the indicator.
-    Green = better, Red = worse (for RdYlGn colormap).
+    Tests whether larger areas have better or worse outcomes.
     """
-    df, period = filter_data(indicator_id.value, "ICBs", time_period)
-    gdf = get_boundaries()
-
-    # Merge data with boundaries
-    gdf_plot = gdf.merge(
-        df[['Area Code', 'Area Name', 'Value']],
-        left_on='ICB23CD',
-        right_on='Area Code',
-        how='left'
+    await load_indicator_data(indicator_id.value)
+    return await run_in_threadpool(_get_correlation, indicator_id, area_type, time_period)
+
+
+def _render_map(
+    indicator_id: IndicatorID,
+    boundaries: gpd.GeoDataFrame,
+    time_period: Optional[str],
+    cmap: ColorMap,
+    figsize_width: float,
+    figsize_height: float,
+    dpi: int,
+    title: Optional[str]
+) -> io.BytesIO:
+    verts, ring_codes, aspect, rings_token = get_boundary_rings(boundaries)
+    values, period = get_map_values(indicator_id.value, ring_codes, rings_token, time_period)
+
+    png_key = (
+        "map_png", indicator_id.value, period, rings_token,
+        cmap.value, figsize_width, figsize_height, dpi, title
     )
+    with _map_png_lock:
+        png = _map_png_cache.get(png_key)
+    if png is not None:
+        return io.BytesIO(png)
+
+    fig = get_figure(figsize_width, figsize_height, dpi)
+    ax = fig.add_subplot()
+
+    # One collection for all ICBs rather than a patch per geometry
+    polygons = PolyCollection(
+        verts,
+        array=np.ma.masked_invalid(values),
+        cmap=matplotlib.colormaps[cmap.value].with_extremes(bad='lightgrey'),
+        edgecolors='white',
+        linewidths=0.3
+    )
+    ax.add_collection(polygons)
+    ax.autoscale_view()
+    ax.set_aspect(aspect)
 
-    # Create figure
-    fig, ax = plt.subplots(figsize=(figsize_width, figsize_height))
-
-    gdf_plot.plot(
-        column='Value',
+    fig.colorbar(
+        polygons,
         ax=ax,
-        legend=True,
-        legend_kwds={
-            'label': f"% - {INDICATOR_INFO[indicator_id.value]['name']}",
-            'orientation': 'horizontal',
-            'shrink': 0.8,
-            'pad': 0.02
-        },
-        cmap=cmap.value,
-        missing_kwds={'color': 'lightgrey', 'label': 'No data'},
-        edgecolor='white',
-        linewidth=0.3
+        label=f"% - {_INDICATOR_BY_ID[indicator_id]['name']}",
+        orientation='horizontal',
+        shrink=0.8,
+        pad=0.02
     )
 
-    map_title = title or f"{INDICATOR_INFO[indicator_id.value]['name']}\nby ICB - {period}"
+    map_title = title or f"{_INDICATOR_BY_ID[indicator_id]['name']}\nby ICB - {period}"
     ax.set_title(map_title, fontsize=14, fontweight='bold')
     ax.axis('off')
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    # Save to buffer
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=dpi, bbox_inches='tight')
-    plt.close(fig)
-    buf.seek(0)
+    buf = encode_png(fig)
 
-    if format == "base64":
-        encoded = base64.b64encode(buf.getvalue()).decode('utf-8')
-        return {"image": encoded, "format": "base64"}
+    # Capped by count and by total bytes: high-DPI maps run to many MB each
+    png = buf.getvalue()
+    with _map_png_lock:
+        _map_png_cache[png_key] = png
+        total_bytes = sum(len(cached_png) for cached_png in _map_png_cache.values())
+        while total_bytes > MAP_PNG_CACHE_BYTES:
+            _, evicted = _map_png_cache.popitem()
+            total_bytes -= len(evicted)
 
-    return StreamingResponse(buf, media_type="image/png")
+    return buf
 
 
-@app.get("/chart", tags=["Visualization"])
-def generate_chart(
+@app.get("/map", tags=["Visualization"])
+async def generate_map(
     indicator_id: IndicatorID = Query(IndicatorID.TYPE1_9_CARE_PROCESSES, description="Indicator ID"),
-    area_type: AreaType = Query(AreaType.ICBS, description="Area type"),
     time_period: Optional[str] = Query(None, description="Time period. Defaults to latest."),
+    cmap: ColorMap = Query(ColorMap.RdYlGn, description="Color scheme"),
     figsize_width: float = Query(10, ge=5, le=20, description="Figure width in inches"),
-    figsize_height: float = Query(6, ge=4, le=12, description="Figure height in inches"),
+    figsize_height: float = Query(12, ge=5, le=24, description="Figure height in inches"),
     dpi: int = Query(100, ge=50, le=300, description="Resolution (DPI)"),
-    point_color: str = Query("steelblue", description="Scatter point color"),
-    show_regression: bool = Query(True, description="Show regression line"),
     title: Optional[str] = Query(None, description="Custom title"),
     format: Literal["png", "base64"] = Query("png", description="Output format")
 ):
     """
-    Generate a scatter plot of population size vs care quality.
+    Generate a choropleth map of ICB areas.
 
-    Shows relationship between number of patients and indicator value.
+    Returns a PNG image showing geographic distribution of the indicator.
+    Green = better, Red = worse (for RdYlGn colormap).
     """
-    df, period = filter_data(indicator_id.value, area_type.value, time_period)
-    df = df.dropna(subset=['Value', 'Denominator'])
+    await load_indicator_data(indicator_id.value)
+    boundaries = await load_boundaries()
+    buf = await run_in_threadpool(
+        _render_map, indicator_id, boundaries, time_period, cmap,
+        figsize_width, figsize_height, dpi, title
+    )
 
-    x = df['Denominator']
-    y = df['Value']
+    if format == "base64":
+        encoded = pybase64.b64encode(buf.getbuffer()).decode('ascii')
+        return NumpyJSONResponse({"image": encoded, "format": "base64"})
+
+    return StreamingResponse(buf, media_type="image/png")
 
-    fig, ax = plt.subplots(figsize=(figsize_width, figsize_height))
+
+def _render_chart(
+    indicator_id: IndicatorID,
+    area_type: AreaType,
+    time_period: Optional[str],
+    figsize_width: float,
+    figsize_height: float,
+    dpi: int,
+    point_color: str,
+    show_regression: bool,
+    title: Optional[str]
+) -> io.BytesIO:
+    arrays, period = get_area_arrays(indicator_id.value, area_type.value, time_period)
+    x = arrays["paired_denominators"]
+    y = arrays["paired_values"]
+
+    fig = get_figure(figsize_width, figsize_height, dpi)
+    ax = fig.add_subplot()
 
     ax.scatter(x, y, alpha=0.7, edgecolor='black', s=60, color=point_color)
 
@@ -465,19 +924,42 @@ def generate_chart(
     ax.set_xlabel('Number of Patients')
     ax.set_ylabel('% Value')
 
-    chart_title = title or f"{INDICATOR_INFO[indicator_id.value]['name']}\nPopulation vs Quality - {period}"
+    chart_title = title or f"{_INDICATOR_BY_ID[indicator_id]['name']}\nPopulation vs Quality - {period}"
     ax.set_title(chart_title, fontsize=12, fontweight='bold')
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=dpi, bbox_inches='tight')
-    plt.close(fig)
-    buf.seek(0)
+    buf = encode_png(fig)
+    return buf
+
+
+@app.get("/chart", tags=["Visualization"])
+async def generate_chart(
+    indicator_id: IndicatorID = Query(IndicatorID.TYPE1_9_CARE_PROCESSES, description="Indicator ID"),
+    area_type: AreaType = Query(AreaType.ICBS, description="Area type"),
+    time_period: Optional[str] = Query(None, description="Time period. Defaults to latest."),
+    figsize_width: float = Query(10, ge=5, le=20, description="Figure width in inches"),
+    figsize_height: float = Query(6, ge=4, le=12, description="Figure height in inches"),
+    dpi: int = Query(100, ge=50, le=300, description="Resolution (DPI)"),
+    point_color: str = Query("steelblue", description="Scatter point color"),
+    show_regression: bool = Query(True, description="Show regression line"),
+    title: Optional[str] = Query(None, description="Custom title"),
+    format: Literal["png", "base64"] = Query("png", description="Output format")
+):
+    """
+    Generate a scatter plot of population size vs care quality.
+
+    Shows relationship between number of patients and indicator value.
+    """
+    await load_indicator_data(indicator_id.value)
+    buf = await run_in_threadpool(
+        _render_chart, indicator_id, area_type, time_period,
+        figsize_width, figsize_height, dpi, point_color, show_regression, title
+    )
 
     if format == "base64":
-        encoded = base64.b64encode(buf.getvalue()).decode('utf-8')
-        return {"image": encoded, "format": "base64"}
+        encoded = pybase64.b64encode(buf.getbuffer()).decode('ascii')
+        return NumpyJSONResponse({"image": encoded, "format": "base64"})
 
     return StreamingResponse(buf, media_type="image/png")
 
@@ -485,11 +967,30 @@ def generate_chart(
 @app.post("/cache/clear", tags=["Admin"])
 def clear_cache():
     """Clear the data cache to fetch fresh data"""
-    _cache.clear()
+    with _cache_lock:
+        _cache.clear()
+        _boundaries_cache.clear()
+        _arrays_cache.clear()
+        _map_values_cache.clear()
+    for indicator_id in IndicatorID:
+        discard_frame(f"indicator_{indicator_id.value}")
+    with _map_png_lock:
+        _map_png_cache.clear()
     return {"message": "Cache cleared"}
 
 
 @app.get("/health", tags=["Admin"])
 def health():
     """Health check"""
-    return {"status": "ok", "cache_size": len(_cache)}
+    info = get_indicator_data.cache_info()
+    return {
+        "status": "ok",
+        "cache_size": len(_cache),
+        "cache": {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": len(_cache),
+            "maxsize": _cache.maxsize,
+            "ttl": CACHE_TTL,
+        }
+    }
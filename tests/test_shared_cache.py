@@ -0,0 +1,66 @@
+"""Frames published by one worker process must be readable by another."""
+
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+import _shared_cache  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+PUBLISH = """
+import sys
+import pandas as pd
+import _shared_cache
+frame = pd.DataFrame({
+    "AreaCode": pd.array(["E54000050", "E54000051"], dtype="string[pyarrow]"),
+    "Value": [71.25, 68.5],
+    "Count": pd.array([120, 95], dtype="Int32"),
+})
+sys.exit(0 if _shared_cache.publish_frame(sys.argv[1], frame) else 1)
+"""
+
+READ = """
+import sys
+import _shared_cache
+sys.exit(0 if _shared_cache.read_frame(sys.argv[1], 60) is not None else 1)
+"""
+
+
+def _run(script, name):
+    return subprocess.run([sys.executable, "-c", script, name], cwd=REPO_ROOT, capture_output=True, text=True)
+
+
+@pytest.fixture
+def name():
+    name = f"test_{uuid.uuid4().hex}"
+    yield name
+    _shared_cache.discard_frame(name)
+
+
+def test_frame_published_in_another_process_is_readable(name):
+    result = _run(PUBLISH, name)
+    assert result.returncode == 0, result.stderr
+
+    shared = _shared_cache.read_frame(name, 60)
+    assert shared is not None
+    frame, _ = shared
+    assert frame["AreaCode"].tolist() == ["E54000050", "E54000051"]
+    assert frame["AreaCode"].dtype == pd.StringDtype("pyarrow")
+    assert frame["Value"].tolist() == [71.25, 68.5]
+    assert frame["Count"].tolist() == [120, 95]
+
+
+def test_block_outlives_the_processes_that_used_it(name):
+    assert _run(PUBLISH, name).returncode == 0
+    result = _run(READ, name)
+    assert result.returncode == 0, result.stderr
+
+    # Neither the publisher's nor the reader's exit may unlink the block
+    assert _shared_cache.read_frame(name, 60) is not None